@@ -46,10 +46,10 @@ out = os.path.abspath(args.output)
 p_dirs = [d for d in os.listdir(dir) if os.path.isdir(os.path.join(dir,d))]
 
 
-# base prediction data
-pred = np.zeros([1,5])
-# base evaluation labels data
-evaluation_labels = np.asarray([])
+# lists of the predictions and evaluation labels of every participant, joined
+# once all participants are processed
+pred = []
+evaluation_labels = []
 
 # iterate over every directory in the provided directory
 for p in p_dirs:
@@ -67,13 +67,17 @@ for p in p_dirs:
 
     # have to model compute predictions for all the data
     for d in data:
-        pred = np.concatenate((pred, model.predict(np.expand_dims(d,axis=0))), axis=0)
+        pred.append(model.predict(np.expand_dims(d,axis=0)))
 
     # append the validation labels
-    evaluation_labels = np.concatenate((evaluation_labels, label))
+    evaluation_labels.append(label)
+
+# join the predictions and labels of all participants
+pred = np.concatenate(pred, axis=0)
+evaluation_labels = np.concatenate(evaluation_labels)
 
 # compute the confusion matrix
-conf_mat = sklearn.metrics.confusion_matrix(evaluation_labels, pred[1:,...].argmax(axis=1)+1, labels=range(1,6))
+conf_mat = sklearn.metrics.confusion_matrix(evaluation_labels, pred.argmax(axis=1)+1, labels=range(1,6))
 conf_mat = conf_mat/conf_mat.sum(axis=1, keepdims=True)
 
 
@@ -60,13 +60,15 @@ model = keras.models.load_model(args.Model)
 print('Done')
 
 
-predictions = np.ndarray((1,5))
+# list of the predictions, joined once all windows are predicted
+predictions = []
 
 print('Computing predictions...')
 for window in frames:
     # predictions = model.predict(frames)
     pred = model.predict(np.expand_dims(window,axis=0))
-    predictions = np.concatenate((predictions, pred),axis=0)
+    predictions.append(pred)
+predictions = np.concatenate(predictions, axis=0)
 print('Done')
 
 # output file
@@ -76,4 +78,4 @@ out = os.path.join(args.output,
         else 'p{}_lecture_video_predictions.npy'.format(args.participant))
 
 print('Saving predictions to {}..'.format(out))
-np.save(out, predictions[1:,...])
+np.save(out, predictions)
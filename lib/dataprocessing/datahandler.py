@@ -33,10 +33,13 @@ class DataHandler:
         # subsample rate
         self.__subsample = subsample
 
-        # the numpy array to store all the frames in
-        self.__data   = np.zeros([1, *shape], dtype=np.uint8)
-        # the numpy array to hold the labels
-        self.__labels = np.zeros(1, dtype=np.uint8)
+        # the shape of a single chunk of frames
+        self.__shape = shape
+
+        # lists of the chunks and their labels, they are joined into numpy
+        # arrays only once the data is retrieved
+        self.__data   = []
+        self.__labels = []
 
 
 
@@ -57,7 +60,7 @@ class DataHandler:
         """
 
         # get the windowsize
-        windowsize = self.__data.shape[1]
+        windowsize = self.__shape[0]
 
         for x in range(0, self.__subsample):
             # subsample the frames using numpy magic
@@ -78,12 +81,10 @@ class DataHandler:
                 # add the segments to the data
                 for segment in segments:
                     # reshape to the right dimension if needed
-                    segment  = np.reshape(segment, self.__data.shape[1:])
-
-                    self.__data   = np.concatenate((self.__data, np.expand_dims(segment, axis=0)), axis=0)
-                    self.__labels = np.append(self.__labels, np.expand_dims(ground_truth, axis=0))
+                    self.__data.append(np.reshape(segment, self.__shape))
+                    self.__labels.append(ground_truth)
 
-        assert self.__data.shape[0] == self.__labels.shape[0]
+        assert len(self.__data) == len(self.__labels)
 
 
 
@@ -95,7 +96,11 @@ class DataHandler:
                 labels
         """
 
-        return self.__data[1:,...], self.__labels[1:]
+        # join the chunks into a single array
+        data   = np.array(self.__data, dtype=np.uint8).reshape(-1, *self.__shape)
+        labels = np.array(self.__labels)
+
+        return data, labels
 
 
 
@@ -120,10 +125,10 @@ class DataHandler:
         # create the filename
         name_str = '{}_{}@{}_{}x{}{}'.format(
             name,
-            self.__data.shape[1],
+            self.__shape[0],
             self.__subsample,
-            self.__data.shape[2],
-            self.__data.shape[2],
+            self.__shape[1],
+            self.__shape[1],
             '_{}'.format(suffix) if suffix else suffix
         )
 
@@ -131,8 +136,9 @@ class DataHandler:
         data_path   = os.path.join(path, '{}_data.npy'.format(name_str))
         labels_path = os.path.join(path, '{}_labels.npy'.format(name_str))
 
-        # write the data without the very first zero entry
-        np.save(data_path, self.__data[1:,...])
-        np.save(labels_path, self.__labels[1:])
+        # write the data
+        data, labels = self.get_data()
+        np.save(data_path, data)
+        np.save(labels_path, labels)
 
         return data_path, labels_path
@@ -14,6 +14,8 @@ class ExperimentData:
     Methods:
         get_trials(n)
             returns all trials with timestamps for a given n
+        get_scores(n)
+            returns the scores of all trials for a given n
         get_video_lecture_timestamps()
             returns a tuple with start and end timestamp for the video lecture
     """
@@ -86,6 +88,23 @@ class ExperimentData:
 
 
 
+    def get_scores(self, n: int):
+        """ Gets the scores for all trials of difficulty level n
+
+        Returns the same scores as get_trials, in the same order, without
+        computing the timestamps of the trials
+
+        Parameters:
+            n (int): difficulty level / n step. Range 1-5
+
+        Returns:
+            list: list of the scores of the trials of difficulty level n
+        """
+
+        return [self.__score(trial) for trial in self.__n_back_data[n]]
+
+
+
     def get_video_lecture_timestamps(self):
         """Gets the starting and ending timestamp of the video lecture
 
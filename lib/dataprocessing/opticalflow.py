@@ -13,6 +13,15 @@ class OpticalFlow:
     """
 
 
+    def __init__(self):
+
+        # buffers reused for every pair of frames, they are allocated for the
+        # first frame size and only reallocated if the frame size changes
+        self.__hsv  = None
+        self.__flow = None
+
+
+
     def optical_flow(self, prev: np, curr: np):
         """computes the optical flow between two consecutive video frames
 
@@ -28,20 +37,25 @@ class OpticalFlow:
             np: optical flow rgb image of the same height and width as the input
                 images
         """
-        
-        # hsv matrix to store the optical flow values
-        hsv = np.zeros([*prev.shape,3], dtype=np.uint8)
-        hsv[...,1] = 255 # saturation
+
+        if self.__hsv is None or self.__hsv.shape[:2] != prev.shape:
+            # hsv matrix to store the optical flow values
+            self.__hsv = np.zeros([*prev.shape,3], dtype=np.uint8)
+            self.__hsv[...,1] = 255 # saturation
+            # matrix to store the flow vectors
+            self.__flow = np.zeros([*prev.shape,2], dtype=np.float32)
+
+        hsv = self.__hsv
 
         # compute the optical flow between the two
-        flow = cv2.calcOpticalFlowFarneback(prev, curr, None, 0.5, 3, 15, 3, 5, 1.2, 0)
+        flow = cv2.calcOpticalFlowFarneback(prev, curr, self.__flow, 0.5, 3, 15, 3, 5, 1.2, 0)
 
-        # process the optical flow
-        mag, ang = cv2.cartToPolar(flow[...,0], flow[...,1])
+        # process the optical flow with the angle directly in degrees
+        mag, ang = cv2.cartToPolar(flow[...,0], flow[...,1], angleInDegrees=True)
 
         # interprete the angle and orientations from the optical flow as colors
-        hsv[...,0] = ang*180/np.pi/2
-        hsv[...,2] = cv2.normalize(mag,None,0,255,cv2.NORM_MINMAX)
+        hsv[...,0] = ang/2
+        hsv[...,2] = cv2.normalize(mag,mag,0,255,cv2.NORM_MINMAX)
         of_image = cv2.cvtColor(hsv,cv2.COLOR_HSV2BGR)
 
         return of_image
@@ -13,7 +13,9 @@ class VideoHandler:
     Class representing a video handler, that stores a video from the experiment
     and offers methods to extract information from it.
 
-    It keeps a reference to the video which can be accessed when needed
+    It keeps a reference to the video which can be accessed when needed. The
+    video is read sequentially, so requesting the timespans in chronological
+    order decodes the video in a single pass without seeking
 
     Methods:
         set_video(video_path)
@@ -28,6 +30,9 @@ class VideoHandler:
             retrieves the frames between two timestamps, cropped to the right
             eye, and computes the optical flow between consecutive
             frames
+        batch_process(intervals, kind, crop, progress)
+            retrieves the frames for multiple timespans in a single pass over
+            the video, cropped to the face, the eye or as optical flow images
     """
 
 
@@ -42,6 +47,13 @@ class VideoHandler:
 
         # video capture stream
         self.__cap = cv2.VideoCapture(video_path)
+        # frames per second to convert timestamps into frame numbers
+        self.__fps = self.__cap.get(cv2.CAP_PROP_FPS)
+        # number of the frame the next read will return
+        self.__frame_pos = 0
+        # longest gap in frames (2 seconds) that is skipped by reading forward
+        # instead of seeking
+        self.__max_skip = int(self.__fps * 2)
 
         # eye extraction
         self.__ee = EyeExtractor()
@@ -66,6 +78,9 @@ class VideoHandler:
             self.__cap.release()
         # open the new video
         self.__cap.open(video_path)
+        self.__fps = self.__cap.get(cv2.CAP_PROP_FPS)
+        self.__frame_pos = 0
+        self.__max_skip = int(self.__fps * 2)
 
 
 
@@ -88,41 +103,22 @@ class VideoHandler:
             ndarray: numpy array of the shape (frames, crop, crop)
         """
 
-        # calculate the timestamps for the boundaries
-        start_timestamp = ((start - self.__video_start).total_seconds() * 1000)
-        end_timestamp   = ((end   - self.__video_start).total_seconds() * 1000)
-
-
-        # get the framenumber for the last timestamp
-        self.__cap.set(cv2.CAP_PROP_POS_MSEC, end_timestamp)
-        end_frame = self.__cap.get(cv2.CAP_PROP_POS_FRAMES)
-
-
-        # set the video to the beginning and get the frame number
-        self.__cap.set(cv2.CAP_PROP_POS_MSEC, start_timestamp)
-        frame_pos = self.__cap.get(cv2.CAP_PROP_POS_FRAMES)
-
-        # numpy array of frames
-        frames = np.zeros([1,crop,crop], dtype=np.uint8)
+        # numpy array for all the frames in the timespan
+        frames = np.empty([self.__frame_count(start, end), crop, crop], dtype=np.uint8)
+        # number of frames a face was found in
+        count = 0
 
         # iterate over all the frames
-        while(frame_pos <= end_frame):
-            success, frame = self.__cap.read()
-            # if the frame could be read
-            if(success):
-                found, face = self.__fe.extractFace(frame, crop)
-                # if a face was found
-                if(found):
-                    # convert the frame to grayscale
-                    face = cv2.cvtColor(face, cv2.COLOR_BGR2GRAY).astype(np.uint8)
-                    # add it to all the frames
-                    frames = np.concatenate((frames, np.expand_dims(face, axis=0)), axis=0)
-                    # increment the frame number
+        for frame in self.__read_frames(start, end):
+            found, face = self.__fe.extractFace(frame, crop)
+            # if a face was found
+            if(found):
+                # convert the frame to grayscale and add it to all the frames
+                frames[count] = cv2.cvtColor(face, cv2.COLOR_BGR2GRAY)
+                count += 1
 
-            frame_pos = frame_pos+1
-
-        # return all the frames minus the first 0 frame
-        return frames[1:,...]
+        # return only the frames a face was found in
+        return frames[:count]
 
 
 
@@ -147,8 +143,8 @@ class VideoHandler:
         # compute the grayscale frames for the given timespan
         facial_frames = self.get_frames(start, end, crop)
 
-        # optical flow frames
-        of_frames = np.zeros([1, crop, crop, 3], dtype=np.uint8)
+        # optical flow frames, one between every two consecutive frames
+        of_frames = np.empty([max(len(facial_frames)-1, 0), crop, crop, 3], dtype=np.uint8)
 
         for i in range(1, len(facial_frames)):
             # get the two frames to compute the optical flow for
@@ -156,13 +152,10 @@ class VideoHandler:
             curr = facial_frames[i]
 
             # compute the optical flow image between the frames
-            of_image = self.__of.optical_flow(prev, curr)
-
-            # add the frames to the matrix
-            of_frames = np.concatenate((of_frames, np.expand_dims(of_image, axis=0)), axis=0)
+            of_frames[i-1] = self.__of.optical_flow(prev, curr)
 
 
-        return of_frames[1:,...]
+        return of_frames
 
 
     def get_eye_frames(self, start: datetime, end: datetime, crop: int):
@@ -184,37 +177,145 @@ class VideoHandler:
             ndarray: numpy array of the shape (frames, crop, crop)
         """
 
-        # calculate the timestamps for the boundaries
-        start_timestamp = ((start - self.__video_start).total_seconds() * 1000)
-        end_timestamp   = ((end   - self.__video_start).total_seconds() * 1000)
+        # numpy array for all the frames in the timespan
+        frames = np.empty([self.__frame_count(start, end), crop, crop], dtype=np.uint8)
+        # number of frames an eye was found in
+        count = 0
+
+        # iterate over all the frames
+        for frame in self.__read_frames(start, end):
+            # found, eye = self.__ee.get_eye(frame, 64)
+            found, eye = self.__ee.extractEye(frame, 64)
+            if(found):
+                frames[count] = cv2.cvtColor(eye, cv2.COLOR_BGR2GRAY)
+                count += 1
+
+        return frames[:count]
+
+
+
+    def batch_process(self, intervals: dict, kind: str, crop: int, progress=None):
+        """Returns the processed frames for multiple timespans
+
+        The timespans are processed in chronological order, such that the video
+        is decoded in a single forward pass over all of them
+
+        Parameters:
+            intervals (dict):
+                maps a key to a tuple of start and end timestamp
+            kind (str):
+                'face', 'eye' or 'opticalflow', denotes whether the frames are
+                retrieved by get_frames, get_eye_frames or
+                get_optical_flow_frames
+            crop (int):
+                size the images should be cropped to (squared)
+            progress (function, optional):
+                called with the key of every timespan before it is processed,
+                for example to report the progress
+                default: None
+
+        Returns:
+            dict: maps every key to the numpy array of the processed frames
+
+        Raises:
+            KeyError: when kind is not one of the processing methods
+        """
+
+        process_frames = {
+            'face': self.get_frames,
+            'eye': self.get_eye_frames,
+            'opticalflow': self.get_optical_flow_frames
+        }[kind]
+
+        # keys in the order of the start timestamps
+        keys = sorted(intervals, key=lambda key: intervals[key][0])
+
+        frames = {}
+
+        for key in keys:
+            if progress is not None:
+                progress(key)
+            frames[key] = process_frames(*intervals[key], crop)
 
+        return frames
 
-        # get the framenumber for the last timestamp
-        self.__cap.set(cv2.CAP_PROP_POS_MSEC, end_timestamp)
-        end_frame = self.__cap.get(cv2.CAP_PROP_POS_FRAMES)
 
 
-        # set the video to the beginning and get the frame number
-        self.__cap.set(cv2.CAP_PROP_POS_MSEC, start_timestamp)
-        frame_pos = self.__cap.get(cv2.CAP_PROP_POS_FRAMES)
+    def __frame_number(self, timestamp: datetime):
+        """Computes the number of the frame shown at a timestamp
 
-        # numpy array of frames
-        frames = np.zeros([1,crop,crop], dtype=np.uint8)
+        Parameters:
+            timestamp (datetime):
+                timestamp during the recording of the video
+
+        Returns:
+            int: number of the frame in the video
+        """
+
+        milliseconds = (timestamp - self.__video_start).total_seconds() * 1000
+        # timestamps before the start of the recording map to the first frame
+        return max(int(round(milliseconds * self.__fps / 1000)), 0)
+
+
+
+    def __frame_count(self, start: datetime, end: datetime):
+        """Computes the number of frames between two timestamps
+
+        Parameters:
+            start (datetime):
+                start timestamp
+            end (datetime):
+                end timestamp
+
+        Returns:
+            int: number of frames read between the two timestamps
+        """
+
+        return max(self.__frame_number(end) - self.__frame_number(start) + 1, 0)
+
+
+
+    def __read_frames(self, start: datetime, end: datetime):
+        """Reads the frames between two timestamps
+
+        The video is repositioned when the start lies before the current
+        position or further ahead than a short gap. Short gaps, like the ones
+        between consecutive trials, are skipped by reading forward, which keeps
+        the decoding linear for chronological timespans
+
+        Parameters:
+            start (datetime):
+                start timestamp
+            end (datetime):
+                end timestamp
+
+        Yields:
+            ndarray: every frame between the two timestamps that could be read
+        """
+
+        start_frame = self.__frame_number(start)
+        end_frame   = self.__frame_number(end)
+
+        # seek if the start was already passed or is too far ahead to read
+        # forward to it
+        if start_frame < self.__frame_pos or start_frame - self.__frame_pos > self.__max_skip:
+            self.__cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+            # keep the cursor at the position the capture actually moved to
+            self.__frame_pos = int(self.__cap.get(cv2.CAP_PROP_POS_FRAMES))
+
+        # skip the frames of a short gap, grab still decodes them but does not
+        # convert them into images
+        while self.__frame_pos < start_frame:
+            self.__cap.grab()
+            self.__frame_pos += 1
 
         # iterate over all the frames
-        while(frame_pos <= end_frame):
+        while self.__frame_pos <= end_frame:
             success, frame = self.__cap.read()
+            self.__frame_pos += 1
             # if the frame could be read
             if(success):
-                # found, eye = self.__ee.get_eye(frame, 64)
-                found, eye = self.__ee.extractEye(frame, 64)
-                if(found):
-                    eye = cv2.cvtColor(eye, cv2.COLOR_BGR2GRAY).astype(np.uint8)
-                    frames = np.concatenate((frames, np.expand_dims(eye, axis=0)), axis=0)
-
-            frame_pos += 1
-
-        return frames[1:,...]
+                yield frame
 
 
 
@@ -59,8 +59,8 @@ class DataHandler:
         assert self.__valid_data.shape[0] == self.__valid_labels.shape[0]
 
         # normalisation
-        self.__train_data = (self.__train_data - np.mean(self.__train_data)) / np.std(self.__train_data)
-        self.__valid_data = (self.__valid_data - np.mean(self.__valid_data)) / np.std(self.__valid_data)
+        self.__train_data = self.__normalise(self.__train_data)
+        self.__valid_data = self.__normalise(self.__valid_data)
 
 
 
@@ -87,3 +87,28 @@ class DataHandler:
         """
 
         return self.__valid_data, self.__valid_labels
+
+
+
+    def __normalise(self, data: np.ndarray):
+        """Normalises the 8 bit frames to zero mean and unit variance
+
+        The frames are stored as uint8 on disk and only converted to float32,
+        the precision keras trains with, when they are normalised
+
+        Parameters:
+            data (np.ndarray): the frames as stored on disk
+
+        Returns:
+            np.ndarray: the normalised frames as float32
+        """
+
+        mean = np.float32(np.mean(data))
+        std  = np.float32(np.std(data))
+
+        # normalise the converted copy in place
+        normalised  = data.astype(np.float32)
+        normalised -= mean
+        normalised /= std
+
+        return normalised
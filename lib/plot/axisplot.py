@@ -12,15 +12,24 @@ def loss_axisplot(data: list, labels: list):
         plot or to plot the loss developement of multiple models into one plot
 
         This function used matplotlib and sets the state for the pyplot object.
-        This means this function has side-effects
+        This means this function has side-effects. If there is no data nothing
+        is plotted and no figure is created
 
         data (list):
             list of loss datasets that should be plotted
         labels (list):
             list of strings denoting the labels for the loss data given in data
+
+        Raises:
+            ValueError: when the number of datasets and labels differ
     """
 
-    assert len(data) == len(labels)
+    if len(data) != len(labels):
+        raise ValueError('Got {} datasets but {} labels'.format(len(data), len(labels)))
+
+    # no figure for no data
+    if len(data) == 0:
+        return None
 
     fig, ax = plt.subplots()
 
@@ -32,17 +41,23 @@ def loss_axisplot(data: list, labels: list):
     # epochs on the x axis
     x_axis = np.arange(len(data[0]))+1
 
+    # colours for the data entries
+    palette = colours()
+
     # add every data entry with the respective label
     for i in range(len(data)):
-        plt.plot(x_axis, data[i], label=labels[i], color=colours()[i+2])
+        plt.plot(x_axis, data[i], label=labels[i], color=palette[i+2])
 
     loc, _ = plt.yticks()
 
-    for y in loc[1:-1]:
-        plt.plot(
-            np.arange(len(data[0]))+1,
-            [y] * len(data[0]),
-            "--",
+    # add the horizontal dashed lines as a single line collection, there are
+    # no lines to span if the datasets have no epochs
+    if len(x_axis) > 0:
+        ax.hlines(
+            loc[1:-1],
+            x_axis[0],
+            x_axis[-1],
+            linestyles="--",
             lw=0.5,
             color="black",
             alpha=0.3
@@ -60,15 +75,24 @@ def accuracy_axisplot(data: list, labels: list):
         plot or to plot the accuracy developement of multiple models into one plot
 
         This function used matplotlib and sets the state for the pyplot object.
-        This means this function has side-effects
+        This means this function has side-effects. If there is no data nothing
+        is plotted and no figure is created
 
         data (list):
             list of accuracy datasets that should be plotted
         labels (list):
             list of strings denoting the labels for the accuracy data given in data
+
+        Raises:
+            ValueError: when the number of datasets and labels differ
     """
 
-    assert len(data) == len(labels)
+    if len(data) != len(labels):
+        raise ValueError('Got {} datasets but {} labels'.format(len(data), len(labels)))
+
+    # no figure for no data
+    if len(data) == 0:
+        return None
 
     fig, ax = plt.subplots()
 
@@ -77,12 +101,14 @@ def accuracy_axisplot(data: list, labels: list):
     # epochs on the x axis
     x_axis = np.arange(len(data[0]))+1
 
-    # add the horizontal dashed lines
-    for y in np.arange(0, 1, 0.1):
-        plt.plot(
-            np.arange(len(data[0]))+1,
-            [y] * len(data[0]),
-            "--",
+    # add the horizontal dashed lines as a single line collection, there are
+    # no lines to span if the datasets have no epochs
+    if len(x_axis) > 0:
+        ax.hlines(
+            np.arange(0, 1, 0.1),
+            x_axis[0],
+            x_axis[-1],
+            linestyles="--",
             lw=0.5,
             color="black",
             alpha=0.3
@@ -97,9 +123,12 @@ def accuracy_axisplot(data: list, labels: list):
     plt.xlabel('Epochs', fontsize=12)
     plt.ylabel('Accuracy', fontsize=12)
 
+    # colours for the data entries
+    palette = colours()
+
     # add every data entry with the respective label
     for i in range(len(data)):
-        plt.plot(x_axis, data[i], label=labels[i], color=colours()[i])
+        plt.plot(x_axis, data[i], label=labels[i], color=palette[i])
 
     plt.legend(loc='upper right')
 
@@ -110,14 +139,24 @@ def acc_distribution_plot(accuracies: list, labels: list):
         The achieved accuracies are denoted on the y-axis and the number of users,
         for which this accuracy was achieved is denoted on the x-axis
 
+        If there are no accuracies nothing is plotted and no figure is created
+
         accuracies (list):
             list of lists of top accuracies achieved by the different models
             one list per approach, that contains the top accuracies for every user
         labels (list):
             label for the different approaches
+
+        Raises:
+            ValueError: when the number of approaches and labels differ
     """
 
-    assert len(accuracies) == len(labels)
+    if len(accuracies) != len(labels):
+        raise ValueError('Got {} approaches but {} labels'.format(len(accuracies), len(labels)))
+
+    # no figure for no data
+    if len(accuracies) == 0:
+        return None
 
     fig, ax = plt.subplots()
 
@@ -138,25 +177,30 @@ def acc_distribution_plot(accuracies: list, labels: list):
     # x axis markers
     steps = np.arange(0,1.05,0.05)
 
-    # plot vertical lines for the accuracy
-    for acc in np.arange(0.1,1.1,0.1):
-        ax.axvline(
-            acc,
-            0.04,
-            1,
-            linestyle="--",
-            lw=0.5,
-            color="black",
-            alpha=0.3
-        )
+    # plot vertical lines for the accuracy as a single line collection
+    # the y limits are given in axes coordinates like for axvline
+    ax.vlines(
+        np.arange(0.1,1.1,0.1),
+        0.04,
+        1,
+        transform=ax.get_xaxis_transform(),
+        linestyles="--",
+        lw=0.5,
+        color="black",
+        alpha=0.3
+    )
+
+    # threshold all the accuracies for the plot, one row per approach
+    plot_data = np.empty((len(accuracies), len(steps)), dtype=np.int64)
+
+    for i, data in enumerate(accuracies):
+        # in the sorted accuracies the number of accuracies above a threshold is
+        # the number of entries right of the position the threshold is inserted at
+        plot_data[i] = len(data) - np.searchsorted(np.sort(data), steps, side='right')
 
-    # threshold all the accuracies for the plot
-    plot_data = [[
-        np.count_nonzero(data>threshold)
-        for threshold
-        in steps
-    ] for data in accuracies]
 
+    # every second colour for the accuracy distributions
+    palette = colours()[::2]
 
     # plot the accuracy _distributions
     for i in range(len(plot_data)):
@@ -165,7 +209,7 @@ def acc_distribution_plot(accuracies: list, labels: list):
             plot_data[i],
             'o-',
             label=labels[i],
-            color=colours()[::2][i],
+            color=palette[i],
             clip_on=False
         )
 
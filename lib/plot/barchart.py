@@ -17,7 +17,8 @@ def barchart(
     multi-user basis. One bargroup per user with a bar per values
 
     This function used matplotlib and sets the state for the pyplot object.
-    This means this function has side-effects
+    This means this function has side-effects. If there is no data nothing
+    is plotted and no figure is created
 
     labels (list):
         labels for the x-axis, usually the user names / IDs
@@ -28,9 +29,16 @@ def barchart(
     y_label (String):
         label for the y-axis
 
+    Raises:
+        ValueError: when the number of datasets and data labels differ
     """
 
-    assert len(data) == len(data_label)
+    if len(data) != len(data_label):
+        raise ValueError('Got {} datasets but {} data labels'.format(len(data), len(data_label)))
+
+    # no figure for no data
+    if len(data) == 0:
+        return None
 
     # get the positions for the bars
     x = np.arange(len(labels))
@@ -45,8 +53,10 @@ def barchart(
     clean_plot(ax)
 
 
-    for y in np.arange(0, 1, 0.1):
-        plt.plot(x, [y] * len(x), "--", lw=0.5, color="black", alpha=0.3)
+    # add the horizontal dashed lines as a single line collection, there are
+    # no lines to span if there are no users
+    if len(x) > 0:
+        ax.hlines(np.arange(0, 1, 0.1), x[0], x[-1], linestyles="--", lw=0.5, color="black", alpha=0.3)
 
     plt.tick_params(bottom=True, left=False, top=False, right=False)
     plt.xticks(x, fontsize=8)
@@ -64,9 +74,12 @@ def barchart(
         bar_offset = width * np.linspace(-border, border, num=len(data))
 
 
+    # colours for the datasets
+    palette = colours()
+
     # plot the bars on the correct positions
     for i, (d, lbl, offs) in enumerate(zip(data, data_label, bar_offset)):
-        ax.bar(x+offs, d, width, label=lbl, color=colours()[i])
+        ax.bar(x+offs, d, width, label=lbl, color=palette[i])
 
 
     # set some options on the axis
@@ -21,14 +21,13 @@ def confusion_mat(model: keras.Model, evaluation_data: np.ndarray, evaluation_la
         Returns:
             np.ndarray: the confusion matrix normalised between 0 and 1
     """
-    pred = np.zeros([1,5])
+    # one row of class probabilities per data sample
+    pred = np.empty([len(evaluation_data), 5])
     # let the model predict the output for the data
-    for d in evaluation_data:
-        pred = np.concatenate((pred, model.predict(np.expand_dims(d,axis=0))), axis=0)
+    for i, d in enumerate(evaluation_data):
+        pred[i,...] = model.predict(np.expand_dims(d,axis=0))[0]
 
-    # print(pred[1:,...])
-    # print(evaluation_labels)
     # compute the confusion matrix
-    mat = sklearn.metrics.confusion_matrix(evaluation_labels, pred[1:,...].argmax(axis=1)+1)
+    mat = sklearn.metrics.confusion_matrix(evaluation_labels, pred.argmax(axis=1)+1)
 
     return mat/mat.sum(axis=1, keepdims=True)
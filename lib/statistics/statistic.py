@@ -8,7 +8,8 @@ class Statistic:
 
        It stores the data in a big numpy array matrix, one row per subject, which
        makes the computing of the various metrics very efficient since most of them
-       are implemented in NumPy anyways
+       are implemented in NumPy anyways. The rows are collected in a list while
+       adding subjects and only stacked into the matrix once it is queried
 
        ...
 
@@ -33,11 +34,14 @@ class Statistic:
 
     def __init__(self):
 
-        # set the data to False intially
-        # will be overwritten by the first data that is added
+        # list of the subject rows added so far, stacked into the data
+        # matrix the first time it is needed
+        self.__rows = []
+
+        # data matrix, None until it is built from the rows
         # rows: participant
         # cols: trial in order 1 1 1 1 1 2 2 2 ... 4 4 5 5 5 5 5
-        self.__data = np.array([False])
+        self.__data = None
 
 
 
@@ -49,26 +53,30 @@ class Statistic:
 
         Parameters:
             data_csv_path (str): path to the csv file generated by JsPsych
+
+        Raises:
+            AssertionError: when the subject does not have 5 trials for every n
         """
 
         # load the subjects data
         exp_data = ExperimentData(data_csv_path)
 
-        # data array as a matrix
-        data = np.zeros([1,25], dtype=float)
+        # scores for every n step, each n step has exactly 5 trials
+        scores = [exp_data.get_scores(n) for n in range(1,6)]
 
-        # iterate over the n steps
-        for n in range(1,6):
-            # iterate over every trial for that n step
-            for i, trial in enumerate(exp_data.get_trials(n)):
-                # write the score to the correct position
-                data[0,((n-1)*5)+i] = trial['score']
+        assert all(len(n_scores) == 5 for n_scores in scores)
 
-        # add the data to the existing data
-        if(self.__data.any()):
-            self.__data = np.concatenate((self.__data, data), axis=0)
-        else:
-            self.__data = data
+        # read the scores into a row in trial order, the scores are the number
+        # of correct answers (0-10) so they fit into 8 bits
+        data = np.fromiter(
+            (score for n_scores in scores for score in n_scores),
+            dtype=np.uint8,
+            count=25
+        )
+
+        # add the row and invalidate the stacked data matrix
+        self.__rows.append(data)
+        self.__data = None
 
 
 
@@ -82,16 +90,10 @@ class Statistic:
                     1 for each n step
         """
 
-        # number of participants
-        p_num = self.__data.shape[0]
-        # output matrix
-        out = np.zeros([p_num, 1])
-
-        for n in range(1,6):
-            mean = np.mean(self.__data[...,(n-1)*5:(n-1)*5+5], axis=1)
-            out = np.concatenate((out, np.expand_dims(mean, axis=1)), axis=1)
+        data = self.__get_data()
 
-        return out[...,1:]
+        # group the columns into (participant, n, trial) and average the trials
+        return data.reshape(data.shape[0], 5, 5).mean(axis=2)
 
 
 
@@ -102,7 +104,11 @@ class Statistic:
                 np.ndarray: 5x1 matrix with the average scores for n=1 to n=5
         """
 
-        return np.mean(self.average_scores_all_subjects(), axis=0)
+        data = self.__get_data()
+
+        # every subject has 5 trials per n, so the mean over all trials of a n
+        # equals the mean of the subject averages
+        return data.reshape(-1, 5, 5).mean(axis=(0,2))
 
 
     def global_std_deviation(self):
@@ -122,15 +128,37 @@ class Statistic:
                 np.ndarray: 5x10 matrix with columns as score and rows as n
 
         """
-        score_count_mat = np.ndarray((5,10))
+        data = self.__get_data()
+
+        # the scores of every n as one row
+        scores = data.reshape(-1, 5, 5).transpose(1, 0, 2).reshape(5, -1).astype(int)
+
+        # offset the scores 0-10 of every n into their own 11 bins, such that all
+        # scores are counted in a single pass
+        bins = scores + 11 * np.arange(5)[:, np.newaxis]
+        score_count = np.bincount(bins.ravel(), minlength=55).reshape(5, 11)
 
-        for n in range(0,5):
-            score_count = [
-                np.count_nonzero(self.__data[...,n*5:n*5+5] == score)
-                for score
-                in np.arange(10)+1
-            ]
+        # omit the count of the score 0
+        return score_count[:, 1:].astype(float)
+
+
+
+    def __get_data(self):
+        """Returns the data matrix with one row per subject
+
+        The rows added with add_subject_data are stacked into the matrix only
+        when it is requested and the matrix is cached until a new subject is
+        added
+
+        Returns:
+            np.ndarray: matrix with a row per subject and 25 columns, one for
+                each trial
+        """
 
-            score_count_mat[n,...] = score_count
+        if self.__data is None:
+            self.__data = np.vstack(self.__rows) if self.__rows else np.zeros([0,25], dtype=np.uint8)
+            # keep the stacked matrix as the only entry such that later rows
+            # are stacked onto it instead of onto every single row again
+            self.__rows = [self.__data] if self.__rows else []
 
-        return score_count_mat
+        return self.__data
@@ -47,14 +47,12 @@ print('Output directory: {}'.format(out_dir))
 print('Number of participant data found: {}'.format(len(data_files)))
 print('')
 
-# load the first label file to get the shape
-data_shape = np.load(os.path.join(dir, data_files[0])).shape
-
 # basic name pattern for the output file
 outfile_name = 'all_{}'.format(data_files[0][4:-9])
 
-all_labels = np.ndarray([1])
-all_data =   np.ndarray([1, *data_shape[1:]])
+# lists of the arrays of every participant, joined once all are loaded
+all_labels = []
+all_data   = []
 
 print('Merging files...')
 # transfer all the data to the memory map
@@ -66,16 +64,18 @@ for i, (data_file, labels_file) in (enumerate(zip(data_files, label_files))):
     data   = np.load(os.path.join(dir,data_file))
     labels = np.load(os.path.join(dir,labels_file))
 
-    # all_data[i*data_shape[0]:i*data_shape[0]+data_shape[0],...] = data
-    # all_labels[i*data_shape[0]:i*data_shape[0]+data_shape[0]] = labels
-    all_data = np.concatenate((all_data, data), axis=0)
-    all_labels = np.concatenate((all_labels, labels), axis=0)
+    all_data.append(data)
+    all_labels.append(labels)
 print('')
 
+# join the data of all participants
+all_data   = np.concatenate(all_data, axis=0)
+all_labels = np.concatenate(all_labels, axis=0)
+
 print('Writing data to disc...')
 # save the data
-np.save(os.path.join(out_dir, '{}_data.npy'.format(outfile_name)), all_data[1:,...])
-np.save(os.path.join(out_dir, '{}_labels.npy'.format(outfile_name)), all_labels[1:,...])
+np.save(os.path.join(out_dir, '{}_data.npy'.format(outfile_name)), all_data)
+np.save(os.path.join(out_dir, '{}_labels.npy'.format(outfile_name)), all_labels)
 print("  {}".format(os.path.join(out_dir, '{}_data.npy'.format(outfile_name))))
 print("  {}".format(os.path.join(out_dir, '{}_labels.npy'.format(outfile_name))))
 
@@ -3,11 +3,14 @@ arrays
 
 This script loads the experiment data, recorded by the JsPsych n-back experiment.
 It extracts the timestamps of the trials and loads these chunks of videos from the
-recorded video data. These chunks are then processed frame by frame and stored into
-a numpy array and saved into .npy files. On top of that the ground truth labels are
-stored in a seperate .npy files.
-The script creates two seperate files for each of the 25 trials, a .npy file for the
-frame data and a .json file for the ground truth labels.
+recorded video data in the order they were recorded, reading the video in a single
+pass. These chunks are then processed frame by frame and stored into
+a numpy array for each trial. On top of that the ground truth labels are stored in
+a seperate file.
+The script creates two files for all of the 25 trials, a .npz file named after the
+processing method with one frame array per trial and a labels.json file with the
+ground truth labels. Both store the trials under the key 'n-i', with i being the
+index of the trial for the difficulty level n.
 
 There are three ways to process the video data
     face
@@ -38,11 +41,18 @@ Arguments:
         if this flag is set, instead of the trials the data is extracted for the
         lecture video part of the experiment. This part does not contain ground
         truth data
+    --jobs, -j (optional, int):
+        number of processes that process the trials in parallel. The recorded
+        trials are split into consecutive chunks, at most one per trial, and
+        every process seeks to its chunk and reads that part of the video by
+        itself
+        default: 1
 """
 
 
 
 import argparse
+import concurrent.futures
 import json
 import os
 
@@ -51,111 +61,183 @@ import numpy as np
 import lib.dataprocessing as dp
 
 
-# Argument Parsing
-parser = argparse.ArgumentParser()
-parser.add_argument('ProcessingMethod',
-                     choices=['eye', 'face', 'opticalflow'],
-                     help='Which method to choose for processing the data')
-parser.add_argument('ExperimentData',
-                     help='The directory that holds all the data recorded at the\
-                           N-Back experiment')
-parser.add_argument('--output', '-o',
-                     default='.',
-                     help='Directory to store the output in')
-parser.add_argument('--crop', '-c',
-                     default=64,
-                     help='The crop size for the frames')
-parser.add_argument('--lecture-video', '-lv',
-                     default=False,
-                     action='store_true',
-                     help='If set the frames for the lecture video are extracted')
-arguments = parser.parse_args()
-
-
-# Argument Processing
-method        = arguments.ProcessingMethod
-exp_data_path = os.path.abspath(arguments.ExperimentData)
-output_path   = os.path.abspath(arguments.output)
-cropsize      = int(arguments.crop)
-lecture_video = arguments.lecture_video
-
-
-# Assertion Checks
-assert os.path.exists(exp_data_path) and os.path.isdir(exp_data_path)
-assert os.path.exists(output_path) and os.path.isdir(output_path)
-
-assert cropsize > 0
-
-# retrieve the files from the experiment directory
-exp_json, video_path, participant = dp.util.getExperimentInfo(exp_data_path)
-
-assert os.path.exists(video_path) and os.path.isfile(video_path) \
-    and os.path.splitext(video_path)[1] == '.mp4'
-assert os.path.exists(exp_json) and os.path.isfile(exp_json) \
-    and os.path.splitext(exp_json)[1] == '.json'
-
-
-print('')
-print('Processing Method: {}'.format(method))
-print('Experiment Data: {}'.format(exp_json))
-print('Video: {}'.format(video_path))
-print('Output Path: {}'.format(output_path))
-print('Cropsize: {}'.format(cropsize))
-print('Participant: {}'.format(participant))
-print('Video Part: {}'.format('Lecture Video' if lecture_video else 'N-Back'))
-print('')
-
-# create the data processing objects
-exp_data      = dp.ExperimentData(exp_json)
-video_handler = dp.VideoHandler(video_path)
-
-# choose the right processing function accoding to the method
-method_functions = {
-    'face': video_handler.get_frames,
-    'eye': video_handler.get_eye_frames,
-    'opticalflow': video_handler.get_optical_flow_frames
-}
-process_frames = method_functions[method]
-
-# create the output directory for this participant
-os.makedirs(os.path.join(output_path, participant), exist_ok=True)
-
-if not lecture_video:
-
-    print('Processing N-levels...')
-    # go over every difficulty level
-    for n in range(1,6):
-        print('N={}'.format(n))
-        # get the trial timestampts and score
-        trials = exp_data.get_trials(n)
-
-        # iterate over every trial for this difficulty
-        for i, trial in enumerate(trials):
-            print('  Trial {}'.format(i+1))
-            # get the frames
-            frames = process_frames(trial['start'], trial['end'], cropsize)
-
-            # format the output path and filename
-            out = os.path.join(output_path, participant, '{}-{}-{}'.format(n,i, method))
-            # save the frames
-            np.save('{}.npy'.format(out), frames)
-            # save the gt data as a json file
-            with open('{}.json'.format(out), 'w') as json_file:
-                json.dump({
-                    'n': n,
-                    'score': trial['score']
-                }, json_file)
-
-else:
-
-    print('Processing Lecture Video')
-
-    # get the timestamps for the lecture video
-    start, end = exp_data.get_video_lecture_timestamps()
-    # process the frames
-    frames = process_frames(start, end, cropsize)
-    # format the output path and filename
-    out = os.path.join(output_path, participant, '{}_lecture_video'.format(method))
-    np.save('{}.npy'.format(out), frames)
-
-print('Output written to {}'.format(os.path.join(output_path, participant)))
+def process_trials(video_path: str, method: str, trials: list, cropsize: int):
+    """Processes the frames of a list of trials
+
+    Opens its own video handler such that multiple processes can process
+    different trials at the same time. The handler seeks to the first trial
+    and reads the following trials forward in a single pass
+
+    Parameters:
+        video_path (str):
+            path to the video recorded during the experiment
+        method (str):
+            'eye', 'face' or 'opticalflow'
+        trials (list):
+            list of (n, i, trial) tuples sorted by the start of the trial
+        cropsize (int):
+            the crop size of the extracted images (squared)
+
+    Returns:
+        dict: the frames of every trial stored under the key n-i
+    """
+
+    # the trials stored under the key n-i
+    intervals = {
+        '{}-{}'.format(n,i): (trial['start'], trial['end'])
+        for n, i, trial in trials
+    }
+
+    def print_progress(key):
+        n, i = key.split('-')
+        print('  N={} Trial {}'.format(n, int(i)+1))
+
+    # process the frames of all trials in a single pass over the video
+    trial_frames = dp.VideoHandler(video_path).batch_process(
+        intervals, method, cropsize, progress=print_progress
+    )
+
+    # store the frames as 8 bit images
+    return {
+        key: frames.astype(np.uint8, copy=False)
+        for key, frames in trial_frames.items()
+    }
+
+
+
+# the processes started for the trials import this script, so the processing
+# is only run when it is executed as a script
+if __name__ == '__main__':
+
+    # Argument Parsing
+    parser = argparse.ArgumentParser()
+    parser.add_argument('ProcessingMethod',
+                         choices=['eye', 'face', 'opticalflow'],
+                         help='Which method to choose for processing the data')
+    parser.add_argument('ExperimentData',
+                         help='The directory that holds all the data recorded at the\
+                               N-Back experiment')
+    parser.add_argument('--output', '-o',
+                         default='.',
+                         help='Directory to store the output in')
+    parser.add_argument('--crop', '-c',
+                         default=64,
+                         help='The crop size for the frames')
+    parser.add_argument('--lecture-video', '-lv',
+                         default=False,
+                         action='store_true',
+                         help='If set the frames for the lecture video are extracted')
+    parser.add_argument('--jobs', '-j',
+                         default=1,
+                         help='Number of processes to process the trials with')
+    arguments = parser.parse_args()
+
+
+    # Argument Processing
+    method        = arguments.ProcessingMethod
+    exp_data_path = os.path.abspath(arguments.ExperimentData)
+    output_path   = os.path.abspath(arguments.output)
+    cropsize      = int(arguments.crop)
+    lecture_video = arguments.lecture_video
+    jobs          = int(arguments.jobs)
+
+
+    # Assertion Checks
+    assert os.path.exists(exp_data_path) and os.path.isdir(exp_data_path)
+    assert os.path.exists(output_path) and os.path.isdir(output_path)
+
+    assert cropsize > 0
+    assert jobs > 0
+
+    # retrieve the files from the experiment directory
+    exp_json, video_path, participant = dp.util.getExperimentInfo(exp_data_path)
+
+    assert os.path.exists(video_path) and os.path.isfile(video_path) \
+        and os.path.splitext(video_path)[1] == '.mp4'
+    assert os.path.exists(exp_json) and os.path.isfile(exp_json) \
+        and os.path.splitext(exp_json)[1] == '.json'
+
+
+    print('')
+    print('Processing Method: {}'.format(method))
+    print('Experiment Data: {}'.format(exp_json))
+    print('Video: {}'.format(video_path))
+    print('Output Path: {}'.format(output_path))
+    print('Cropsize: {}'.format(cropsize))
+    print('Participant: {}'.format(participant))
+    print('Video Part: {}'.format('Lecture Video' if lecture_video else 'N-Back'))
+    print('Jobs: {}'.format(jobs))
+    print('')
+
+    # create the data processing objects
+    exp_data = dp.ExperimentData(exp_json)
+
+    # create the output directory for this participant
+    os.makedirs(os.path.join(output_path, participant), exist_ok=True)
+
+    if not lecture_video:
+
+        print('Processing N-levels...')
+        # collect the trials of every difficulty level with their index
+        trials = [
+            (n, i, trial)
+            for n in range(1,6)
+            for i, trial in enumerate(exp_data.get_trials(n))
+        ]
+        # process the trials in the order they were recorded such that the video
+        # is read in a single pass
+        trials.sort(key=lambda entry: entry[2]['start'])
+
+        # frames and ground truth data of every trial, stored under the key n-i
+        trial_frames = {}
+        trial_labels = {
+            '{}-{}'.format(n,i): {
+                'n': n,
+                'score': trial['score']
+            }
+            for n, i, trial in trials
+        }
+
+        # no more processes than trials, such that no process is started
+        # without any work
+        chunk_num = min(jobs, len(trials))
+
+        if chunk_num <= 1:
+            trial_frames = process_trials(video_path, method, trials, cropsize)
+        else:
+            # split the trials into consecutive chunks such that every process
+            # reads a single part of the video
+            chunks = [
+                trials[j*len(trials)//chunk_num:(j+1)*len(trials)//chunk_num]
+                for j in range(chunk_num)
+            ]
+
+            with concurrent.futures.ProcessPoolExecutor(max_workers=chunk_num) as executor:
+                futures = [
+                    executor.submit(process_trials, video_path, method, chunk, cropsize)
+                    for chunk in chunks
+                ]
+                for future in futures:
+                    trial_frames.update(future.result())
+
+        # save the frames of all trials into a single file
+        np.savez(os.path.join(output_path, participant, '{}.npz'.format(method)), **trial_frames)
+        # save the gt data of all trials as a single json file
+        with open(os.path.join(output_path, participant, 'labels.json'), 'w') as json_file:
+            json.dump(trial_labels, json_file)
+
+    else:
+
+        print('Processing Lecture Video')
+
+        # get the timestamps for the lecture video
+        start, end = exp_data.get_video_lecture_timestamps()
+        # process the frames
+        frames = dp.VideoHandler(video_path).batch_process({
+            'lecture_video': (start, end)
+        }, method, cropsize)['lecture_video']
+        # format the output path and filename
+        out = os.path.join(output_path, participant, '{}_lecture_video'.format(method))
+        np.save('{}.npy'.format(out), frames.astype(np.uint8, copy=False))
+
+    print('Output written to {}'.format(os.path.join(output_path, participant)))
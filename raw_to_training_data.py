@@ -1,4 +1,4 @@
-""" This script takes the .npy files extraced by the process_data_raw.py script
+""" This script takes the .npz file extraced by the process_data_raw.py script
 and couples them into files for the training and validation of a model. The script
 works on the data of a single participant and has to be evoked multiple times if you
 want to process the data of multiple participants
@@ -17,8 +17,8 @@ to combine it with the data of other participants.
 
 Arguments:
     RawDataDir
-        The directory containing all the output files (.npy and .json) generated
-        by the process_data_raw.py script
+        The directory containing the output files (.npz and labels.json)
+        generated by the process_data_raw.py script
     --single-person-balanced, -spb (optional, flag)
         If set, the data is split into a training and validation set for this
         single person. The out will be 4 files, training plus validation data and
@@ -55,8 +55,8 @@ from lib.dataprocessing import DataHandler
 
 parser = argparse.ArgumentParser()
 parser.add_argument('RawDataDir',
-                     help='Directory where the frame .npy files and the ground\
-                     truth .json files are stored')
+                     help='Directory where the frame .npz file and the ground\
+                     truth labels.json file are stored')
 parser.add_argument('--single-person-balanced', '-spb',
                      action='store_true',
                      help='If this flag is set, one balanced dataset with training and \
@@ -112,40 +112,42 @@ print('Single Person Balanced: {}'.format(spb))
 print('Two Class: {}'.format(twoclass))
 print('')
 
-# list all the files containing the frames
-frame_files = sorted([os.path.join(exp_data_path, file)
+# find the file containing the frames of all trials
+frame_files = [os.path.join(exp_data_path, file)
                 for file
                 in os.listdir(exp_data_path)
-                if os.path.splitext(os.path.join(exp_data_path, file))[1] == '.npy'
-              ])
+                if os.path.splitext(file)[1] == '.npz'
+              ]
+assert len(frame_files) == 1
 
-# list all the files containing the ground truth values
-gt_files    = sorted([os.path.join(exp_data_path, file)
-                for file
-                in os.listdir(exp_data_path)
-                if os.path.splitext(os.path.join(exp_data_path, file))[1] == '.json'
-              ])
+# the file containing the ground truth values
+gt_file = os.path.join(exp_data_path, 'labels.json')
+assert os.path.exists(gt_file) and os.path.isfile(gt_file)
+
+# open the frames, the arrays are only read once they are accessed
+frame_data = np.load(frame_files[0])
+
+# load the ground truth values for every trial
+with open(gt_file, 'r') as gt_json:
+    gt_data = json.load(gt_json)
+
+# the trials in the order 1-0, 1-1, ... 5-4
+trials = sorted(frame_data.files)
 
 # get the shape of a single frame
-shape = np.load(frame_files[0]).shape[1:]
+shape = frame_data[trials[0]].shape[1:]
 
 # suffix to add to the output files
 suffix = ground_truth
 
 # remove classes 2-3 if twoclass is set
 if twoclass:
-    frame_files = [file
-                    for file
-                    in frame_files
-                    if os.path.basename(file)[0] != '3'
-                    # or os.path.basename(file)[0] == '5'
-                  ]
-    gt_files = [file
-                    for file
-                    in gt_files
-                    if os.path.basename(file)[0] != '3'
-                    # or os.path.basename(file)[0] == '5'
-                  ]
+    trials = [trial
+                for trial
+                in trials
+                if trial[0] != '3'
+                # or trial[0] == '5'
+             ]
     suffix = suffix + '_twoclass'
 
 
@@ -156,25 +158,16 @@ if not spb:
     data_handler = DataHandler((windowsize, *shape, 1), subsample)
 
     # iterate over all the data
-    for frames, gt in zip(frame_files, gt_files):
-        # make sure the two files belong to each other
-        assert os.path.splitext(os.path.basename(frames))[0] == os.path.splitext(os.path.basename(gt))[0]
-
-        # open the gt file
-        with open(gt, 'r') as gt_file:
-            gt_data = json.load(gt_file)
-            # load the frames
-            frame_data = np.load(frames)
-
-            # set the ground truth accordingly
-            if ground_truth == 'n' and twoclass:
-                # merge 1,2 and 4,5 into one class
-                gt = 1 if gt_data[ground_truth] in [1,2] else 2
-            else:
-                gt = gt_data[ground_truth]
+    for trial in trials:
+        # set the ground truth accordingly
+        if ground_truth == 'n' and twoclass:
+            # merge 1,2 and 4,5 into one class
+            gt = 1 if gt_data[trial][ground_truth] in [1,2] else 2
+        else:
+            gt = gt_data[trial][ground_truth]
 
-            # add the frames to the datahandler
-            data_handler.add_frames(frame_data, gt)
+        # add the frames to the datahandler
+        data_handler.add_frames(frame_data[trial], gt)
 
 
     print("Writing data to disk...")
@@ -192,35 +185,26 @@ else:
     train_data_handler = DataHandler((windowsize, *shape, 1), subsample)
     valid_data_handler = DataHandler((windowsize, *shape, 1), subsample)
 
-    for i, (frames, gt) in enumerate(zip(frame_files, gt_files)):
-        # make sure the two files belong to each other
-        assert os.path.splitext(os.path.basename(frames))[0] == os.path.splitext(os.path.basename(gt))[0]
-
-        # open the gt file
-        with open(gt, 'r') as gt_file:
-            gt_data = json.load(gt_file)
-            # load the frames
-            frame_data = np.load(frames)
-
-            # load the ground truth data from the json file
-            # if the ground truth metric is n and the two class option
-            # is set, class 5 should be labeled with 2 for the one hot
-            # encoding returned by keras.utils.to_categorical
-            if ground_truth == 'n' and twoclass:
-                # merge 1,2 and 4,5 into one class
-                gt = 1 if gt_data[ground_truth] in [1,2] else 2
-            else:
-                gt = gt_data[ground_truth]
-
-
-            # validation set
-            # last one of each difficulty is used for validation
-            if (i+1)%5==0:
-                valid_data_handler.add_frames(frame_data, gt)
-            # training set
-            # trials 0-3 are used for training
-            else:
-                train_data_handler.add_frames(frame_data, gt)
+    for i, trial in enumerate(trials):
+        # load the ground truth data from the json file
+        # if the ground truth metric is n and the two class option
+        # is set, class 5 should be labeled with 2 for the one hot
+        # encoding returned by keras.utils.to_categorical
+        if ground_truth == 'n' and twoclass:
+            # merge 1,2 and 4,5 into one class
+            gt = 1 if gt_data[trial][ground_truth] in [1,2] else 2
+        else:
+            gt = gt_data[trial][ground_truth]
+
+
+        # validation set
+        # last one of each difficulty is used for validation
+        if (i+1)%5==0:
+            valid_data_handler.add_frames(frame_data[trial], gt)
+        # training set
+        # trials 0-3 are used for training
+        else:
+            train_data_handler.add_frames(frame_data[trial], gt)
 
 
     print("Writing data to disk...")